@@ -1,20 +1,14 @@
 """The Sipeed NanoKVM integration."""
 from __future__ import annotations
 
-import asyncio
 import logging
 
-import aiohttp
-
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-
-from nanokvm.client import NanoKVMAuthenticationFailure, NanoKVMClient, NanoKVMError
 
 from .const import CONF_SSL_FINGERPRINT, CONF_USE_STATIC_HOST, DOMAIN
-from .coordinator import NanoKVMDataUpdateCoordinator
+from .coordinator import NanoKVMDataUpdateCoordinator, async_create_api_client
 from .services import async_register_services, async_unregister_services
 from .utils import api_connection_options
 
@@ -45,59 +39,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         use_static_host,
     )
 
-    ssl_fingerprint = entry.data.get(CONF_SSL_FINGERPRINT)
-    options = api_connection_options(host, ssl_fingerprint)
-    last_error: Exception | None = None
-    client: NanoKVMClient | None = None
-    device_info = None
-
-    for index, option in enumerate(options):
-        candidate_client = NanoKVMClient(
-            option.base_url,
-            ssl_fingerprint=option.ssl_fingerprint,
-        )
-        try:
-            async with candidate_client:
-                await candidate_client.authenticate(username, password)
-                device_info = await candidate_client.get_info()
-            client = candidate_client
-            break
-        except NanoKVMAuthenticationFailure as err:
-            raise ConfigEntryAuthFailed(
-                f"Authentication failed for NanoKVM at {host}"
-            ) from err
-        except (
-            aiohttp.ServerFingerprintMismatch,
-            aiohttp.ClientConnectorCertificateError,
-        ) as err:
-            if option.scheme == "http" and index < len(options) - 1:
-                last_error = err
-                continue
-            raise ConfigEntryAuthFailed(
-                f"SSL certificate changed for NanoKVM at {host}"
-            ) from err
-        except aiohttp.ClientConnectorError as err:
-            last_error = err
-            if index < len(options) - 1:
-                continue
-            break
-        except (aiohttp.ClientError, NanoKVMError, asyncio.TimeoutError) as err:
-            last_error = err
-            break
-
-    if client is None or device_info is None:
-        assert last_error is not None
-        raise ConfigEntryNotReady(
-            f"Failed to fetch initial device info: {last_error}"
-        ) from last_error
-
+    # The first coordinator refresh authenticates, falls back to HTTPS when
+    # plain HTTP is unavailable, and fetches the initial device state.
+    option = api_connection_options(
+        host, entry.data.get(CONF_SSL_FINGERPRINT)
+    )[0]
     coordinator = NanoKVMDataUpdateCoordinator(
         hass,
         entry,
-        client=client,
+        client=await async_create_api_client(hass, option),
         username=username,
         password=password,
-        device_info=device_info,
     )
 
     await coordinator.async_config_entry_first_refresh()
@@ -106,6 +58,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Started after the platforms connect their dispatcher signals so the
+    # SSH-backed entities created by this refresh are not missed.
+    coordinator.async_schedule_initial_ssh_refresh()
     async_register_services(hass)
 
     return True
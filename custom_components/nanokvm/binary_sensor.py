@@ -27,22 +27,16 @@ from .const import (
     ICON_WIFI,
 )
 from .coordinator import NanoKVMDataUpdateCoordinator
-from .entity import NanoKVMEntity
+from .entity import NanoKVMEntity, always_available, always_create, always_false
 
 
 @dataclass(frozen=True, kw_only=True)
 class NanoKVMBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes NanoKVM binary sensor entity."""
 
-    value_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = (
-        lambda _: False
-    )
-    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = (
-        lambda _: True
-    )
-    should_create_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = (
-        lambda _: True
-    )
+    value_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = always_false
+    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = always_available
+    should_create_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = always_create
 
 
 def _is_alpha_hardware(coordinator: NanoKVMDataUpdateCoordinator) -> bool:
@@ -21,7 +21,7 @@ from .const import (
     ICON_RESET,
 )
 from .coordinator import NanoKVMDataUpdateCoordinator
-from .entity import NanoKVMEntity
+from .entity import NanoKVMEntity, always_available
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -29,7 +29,7 @@ class NanoKVMButtonEntityDescription(ButtonEntityDescription):
     """Describes NanoKVM button entity."""
 
     press_fn: Callable[[NanoKVMDataUpdateCoordinator], Awaitable[None]] | None = None
-    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
+    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = always_available
 
 
 def _is_pcie_hardware(coordinator: NanoKVMDataUpdateCoordinator) -> bool:
@@ -135,6 +135,5 @@ class NanoKVMButton(NanoKVMEntity, ButtonEntity):
         """Press the button."""
         if self.entity_description.press_fn is None:
             raise RuntimeError(f"Missing press handler for button: {self.entity_description.key}")
-        async with self.coordinator.client:
-            await self.entity_description.press_fn(self.coordinator)
+        await self.entity_description.press_fn(self.coordinator)
         await self.coordinator.async_request_refresh()
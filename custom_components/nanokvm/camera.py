@@ -20,7 +20,7 @@ from webrtc_models import RTCIceCandidateInit
 from .camera_webrtc import NanoKVMWebRTCManager
 from .coordinator import NanoKVMDataUpdateCoordinator
 from .const import CONF_SSL_FINGERPRINT, DOMAIN, ICON_HDMI
-from .entity import NanoKVMEntity
+from .entity import NanoKVMEntity, always_available
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,7 +34,7 @@ SNAPSHOT_TIMEOUT_SECONDS = 20
 class NanoKVMCameraEntityDescription(EntityDescription):
     """Describes NanoKVM camera entity."""
 
-    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
+    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = always_available
 
 
 CAMERAS: tuple[NanoKVMCameraEntityDescription, ...] = (
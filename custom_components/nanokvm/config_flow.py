@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import Any
 
 import aiohttp
@@ -10,7 +11,9 @@ import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
 
 from nanokvm.client import NanoKVMClient, NanoKVMAuthenticationFailure, NanoKVMError
@@ -19,6 +22,7 @@ from nanokvm.utils import async_fetch_remote_fingerprint
 from .const import (
     CONF_SSL_FINGERPRINT,
     CONF_USE_STATIC_HOST,
+    DATA_DISCOVERY_CACHE,
     DEFAULT_PASSWORD,
     DEFAULT_USERNAME,
     DOMAIN,
@@ -28,7 +32,14 @@ from .utils import api_connection_options, https_probe_url, normalize_host, norm
 
 _LOGGER = logging.getLogger(__name__)
 
-async def validate_input(data: dict[str, Any]) -> str:
+_DISCOVERY_CACHE_SECONDS = 60
+_DISCOVERY_NEGATIVE_CACHE_SECONDS = 30
+_DISCOVERY_MAX_CACHE_SECONDS = max(
+    _DISCOVERY_CACHE_SECONDS, _DISCOVERY_NEGATIVE_CACHE_SECONDS
+)
+
+
+async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> str:
     """Validate the user input allows us to connect."""
     options = api_connection_options(
         data[CONF_HOST],
@@ -40,6 +51,7 @@ async def validate_input(data: dict[str, Any]) -> str:
         async with NanoKVMClient(
             option.base_url,
             ssl_fingerprint=option.ssl_fingerprint,
+            session=async_get_clientsession(hass),
         ) as client:
             try:
                 await client.authenticate(data[CONF_USERNAME], data[CONF_PASSWORD])
@@ -240,7 +252,7 @@ class NanoKVMConfigFlow(ConfigFlow, domain=DOMAIN):
         self.data = dict(entry.data)
 
         try:
-            await validate_input(self.data)
+            await validate_input(self.hass, self.data)
         except SSLCertificateChanged:
             return await self._async_fetch_and_redirect_ssl("reauth_finish")
         except (InvalidAuth, CannotConnect, Exception):
@@ -269,7 +281,7 @@ class NanoKVMConfigFlow(ConfigFlow, domain=DOMAIN):
             self.data = dict(entry.data) | user_input
 
             try:
-                device_key = await validate_input(self.data)
+                device_key = await validate_input(self.hass, self.data)
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except InvalidAuth:
@@ -298,7 +310,7 @@ class NanoKVMConfigFlow(ConfigFlow, domain=DOMAIN):
         entry = self._get_reauth_entry()
 
         try:
-            device_key = await validate_input(self.data)
+            device_key = await validate_input(self.hass, self.data)
         except InvalidAuth:
             return await self.async_step_reauth_confirm()
         except (CannotConnect, SSLCertificateChanged, Exception) as err:
@@ -353,7 +365,7 @@ class NanoKVMConfigFlow(ConfigFlow, domain=DOMAIN):
             } | user_input
 
             try:
-                await validate_input(data)
+                await validate_input(self.hass, data)
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except InvalidAuth:
@@ -389,7 +401,7 @@ class NanoKVMConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                device_key = await validate_input(self.data)
+                device_key = await validate_input(self.hass, self.data)
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except InvalidAuth:
@@ -429,7 +441,7 @@ class NanoKVMConfigFlow(ConfigFlow, domain=DOMAIN):
             data = self.data | user_input
 
             try:
-                device_key = await validate_input(data)
+                device_key = await validate_input(self.hass, data)
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except InvalidAuth:
@@ -456,11 +468,46 @@ class NanoKVMConfigFlow(ConfigFlow, domain=DOMAIN):
         discovery_hostname = normalize_mdns(discovery_info.hostname)
         discovery_host = discovery_info.host
 
-        async with NanoKVMClient(normalize_host(discovery_host)) as client:
+        # mDNS re-announces devices frequently; skip the HTTP round trip when
+        # this hostname recently resolved to the unique ID of a configured
+        # entry (device key, or legacy mDNS ID for password-protected devices),
+        # or recently failed to answer as a NanoKVM (cached without an ID).
+        discovery_cache: dict[str, tuple[float, str | None]] = self.hass.data.setdefault(
+            DATA_DISCOVERY_CACHE, {}
+        )
+        now = time.monotonic()
+        # Evict expired entries so hostnames seen once on a busy network do
+        # not accumulate for the lifetime of Home Assistant.
+        for hostname, (cached_at, _) in list(discovery_cache.items()):
+            if now - cached_at >= _DISCOVERY_MAX_CACHE_SECONDS:
+                del discovery_cache[hostname]
+        if (cached := discovery_cache.get(discovery_hostname)) is not None:
+            cached_at, cached_unique_id = cached
+            cache_age = now - cached_at
+            if cached_unique_id is None:
+                if cache_age < _DISCOVERY_NEGATIVE_CACHE_SECONDS:
+                    return self.async_abort(reason="cannot_connect")
+            elif (
+                cache_age < _DISCOVERY_CACHE_SECONDS
+                and (entry := self._async_find_matching_entry(cached_unique_id))
+            ):
+                # A cached legacy ID equals the entry's unique ID, so passing
+                # it never triggers a unique ID migration.
+                return self._async_handle_existing_entry(
+                    entry,
+                    discovery_host,
+                    device_key=cached_unique_id,
+                )
+
+        async with NanoKVMClient(
+            normalize_host(discovery_host),
+            session=async_get_clientsession(self.hass),
+        ) as client:
             try:
                 await client.authenticate(DEFAULT_USERNAME, DEFAULT_PASSWORD)
                 device_info = await client.get_info()
                 device_key = str(device_info.device_key)
+                discovery_cache[discovery_hostname] = (time.monotonic(), device_key)
 
                 await self.async_set_unique_id(device_key)
 
@@ -482,8 +529,17 @@ class NanoKVMConfigFlow(ConfigFlow, domain=DOMAIN):
             except NanoKVMAuthenticationFailure:
                 # Fall back to legacy ID path when authentication blocks device_key retrieval.
                 if entry := self._async_find_matching_entry(discovery_hostname):
+                    discovery_cache[discovery_hostname] = (
+                        time.monotonic(),
+                        entry.unique_id,
+                    )
                     return self._async_handle_existing_entry(entry, discovery_host)
 
+                discovery_cache[discovery_hostname] = (
+                    time.monotonic(),
+                    discovery_hostname,
+                )
+
                 await self.async_set_unique_id(discovery_hostname)
                 self._abort_if_unique_id_configured()
                 _LOGGER.debug(
@@ -500,6 +556,7 @@ class NanoKVMConfigFlow(ConfigFlow, domain=DOMAIN):
                     discovery_host,
                     err,
                 )
+                discovery_cache[discovery_hostname] = (time.monotonic(), None)
                 return self.async_abort(reason="cannot_connect")
 
         self.context["title_placeholders"] = {"name": discovery_info.hostname.rstrip(".")}
@@ -10,6 +10,9 @@ CONF_PASSWORD = "password"
 CONF_USE_STATIC_HOST = "use_static_host"
 CONF_SSL_FINGERPRINT = "ssl_fingerprint"
 
+# hass.data keys
+DATA_DISCOVERY_CACHE = f"{DOMAIN}_discovery_cache"
+
 # Default values
 DEFAULT_USERNAME = "admin"
 DEFAULT_PASSWORD = "admin"
@@ -69,6 +72,9 @@ ICON_WATCHDOG = "mdi:shield-refresh"
 ICON_LED_STRIP = "mdi:led-strip-variant"
 ICON_CLOCK = "mdi:clock-outline"
 
+# Coordinator listener contexts
+COORDINATOR_CONTEXT_SSH = "ssh"
+
 # Signals
 SIGNAL_NEW_SSH_SENSORS = "nanokvm_new_ssh_sensors_{}"
 SIGNAL_NEW_SSH_SWITCHES = "nanokvm_new_ssh_switches_{}"
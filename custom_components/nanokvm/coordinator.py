@@ -5,15 +5,19 @@ import asyncio
 import contextlib
 import datetime
 import logging
-from typing import Any
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import aiohttp
 from awesomeversion import AwesomeVersion, AwesomeVersionException
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.importlib import async_import_module
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.exceptions import ConfigEntryAuthFailed
 
@@ -35,30 +39,64 @@ from nanokvm.models import (
 
 from .const import (
     CONF_SSL_FINGERPRINT,
-    CONF_USE_STATIC_HOST,
+    COORDINATOR_CONTEXT_SSH,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    INTEGRATION_TITLE,
     SIGNAL_NEW_MEDIA_ENTITIES,
     SIGNAL_NEW_NETWORK_ENTITIES,
     SIGNAL_NEW_SSH_SENSORS,
     SIGNAL_NEW_SSH_SWITCHES,
 )
-from .ssh_metrics import SSHMetricsCollector
-from .utils import api_connection_options, extract_ssh_host
+from .utils import (
+    NanoKVMAPIConnectionOption,
+    NanoKVMConnectionTarget,
+    api_base_url_to_web_url,
+)
+
+if TYPE_CHECKING:
+    from .ssh_metrics import SSHMetricsCollector, SSHMetricsSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 _UPDATE_MAX_ATTEMPTS = 3
 _UPDATE_RETRY_DELAY_SECONDS = 1
 _UPDATE_TIMEOUT_SECONDS = 10
+_OPTIONAL_REQUEST_TIMEOUT_SECONDS = 3
+# The device's embedded web server degrades when flooded with parallel requests.
+_MAX_CONCURRENT_REQUESTS = 4
 _APP_VERSION_REQUEST_TIMEOUT_SECONDS = 45
 _APP_VERSION_CACHE_SECONDS = 300
 _APP_VERSION_FAILURE_CACHE_SECONDS = 60
+_SLOW_DATA_REFRESH_SECONDS = 300
 _WATCHDOG_MIN_VERSION = AwesomeVersion("2.2.2")
 _INVALID_FILE_CONTENT_CODE = -2
 _INVALID_FILE_CONTENT_MESSAGE = "invalid file content"
 
 
+async def async_create_api_client(
+    hass: HomeAssistant,
+    option: NanoKVMAPIConnectionOption,
+    **kwargs: Any,
+) -> NanoKVMClient:
+    """Create a ready-to-use client on Home Assistant's shared HTTP session.
+
+    The client does not own the session, so leaving its context manager does
+    not close the underlying connections and keep-alive is preserved between
+    polls.
+    """
+    client = NanoKVMClient(
+        option.base_url,
+        ssl_fingerprint=option.ssl_fingerprint,
+        session=async_get_clientsession(hass),
+        **kwargs,
+    )
+    await client.__aenter__()
+    return client
+
+
 def _is_auth_failure(error: Exception) -> bool:
     """Return whether the exception represents invalid credentials."""
     return isinstance(error, NanoKVMAuthenticationFailure) or (
@@ -66,6 +104,22 @@ def _is_auth_failure(error: Exception) -> bool:
     )
 
 
+async def _gather_api_calls(*calls: Coroutine[Any, Any, Any]) -> list[Any]:
+    """Run independent API calls concurrently and raise the first failure.
+
+    The task group cancels the remaining calls as soon as one fails, so no
+    request is left running against the device once the poll has failed. The
+    failure is unwrapped from its exception group so callers can keep handling
+    client errors directly.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(call) for call in calls]
+    except BaseExceptionGroup as err:
+        raise err.exceptions[0] from None
+    return [task.result() for task in tasks]
+
+
 def _is_invalid_file_content_error(error: NanoKVMApiError) -> bool:
     """Return whether the API error is NanoKVM's optional-file missing response."""
     return (
@@ -84,14 +138,19 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
         client: NanoKVMClient,
         username: str,
         password: str,
-        device_info: GetInfoRsp,
     ) -> None:
         """Initialize the coordinator."""
         self.config_entry = config_entry
+        # Host edits always reload the entry, so the parsed target stays valid
+        # for the lifetime of this coordinator.
+        self.connection_target = NanoKVMConnectionTarget.from_host(
+            config_entry.data[CONF_HOST]
+        )
         self.client = client
         self.username = username
         self.password = password
-        self.device_info = device_info
+        self.device_info: GetInfoRsp | None = None
+        self.device_key: str | None = None
         self.hardware_info = None
         self.gpio_info = None
         self.virtual_device_info = None
@@ -114,21 +173,25 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
         self.static_ip = None
         self.swap_size = None
         self.tailscale_status = None
-        self.uptime = None
-        self.cpu_temperature = None
-        self.memory_total = None
-        self.memory_used_percent = None
-        self.storage_total = None
-        self.storage_used_percent = None
+        self.ssh_metrics: SSHMetricsSnapshot | None = None
         self.media_entities_created = False
         self.network_entities_created: set[str] = set()
         self.ssh_sensors_created = False
         self.ssh_switches_created = False
-        self.ssh_metrics_collector = None
+        self.ssh_metrics_collector: SSHMetricsCollector | None = None
         self.hostname_info = None
-        self.watchdog_enabled = None
         self._app_version_last_fetched: datetime.datetime | None = None
+        self._slow_data_last_fetched: datetime.datetime | None = None
+        self._device_registry_info: DeviceInfo | None = None
         self._app_version_fetch_task: asyncio.Task[None] | None = None
+        self._request_slots = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        # Guards creating, clearing and disconnecting the SSH collector so the
+        # deferred first SSH refresh and regular polls never race on it.
+        self._ssh_collector_lock = asyncio.Lock()
+        # Shutdown runs from both unload and the on_unload hook; exit once.
+        self._client_released = False
+        # Reused across polls; entities read coordinator attributes directly.
+        self._data: dict[str, Any] = {}
 
         super().__init__(
             hass,
@@ -139,15 +202,10 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from NanoKVM."""
-        use_static_host = self.config_entry.data.get(CONF_USE_STATIC_HOST, False)
+        # HA already logs each coordinator refresh at debug level; only the
+        # retry path below adds NanoKVM-specific detail.
         current_host = self.config_entry.data[CONF_HOST]
 
-        _LOGGER.debug(
-            "Fetching data from NanoKVM at %s (static_host: %s)",
-            current_host,
-            use_static_host,
-        )
-
         for attempt in range(1, _UPDATE_MAX_ATTEMPTS + 1):
             try:
                 return await self._async_fetch_once()
@@ -213,36 +271,45 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _async_fetch_with_client(self) -> dict[str, Any]:
         """Fetch data using the current client instance."""
-        async with self.client, asyncio.timeout(_UPDATE_TIMEOUT_SECONDS):
+        async with asyncio.timeout(_UPDATE_TIMEOUT_SECONDS):
             if not self.client.token:
-                await self.client.authenticate(self.username, self.password)
+                try:
+                    await self.client.authenticate(self.username, self.password)
+                except NanoKVMAuthenticationFailure as err:
+                    raise ConfigEntryAuthFailed(
+                        "Stored NanoKVM credentials are no longer valid"
+                    ) from err
 
             await self._async_fetch_core_data()
             self._async_maybe_create_network_entities()
             await self._async_fetch_storage_data()
             self._async_maybe_create_media_entities()
-            await self._async_refresh_ssh_data()
+            if self.data is not None:
+                # SSH collection for the first refresh is deferred to
+                # async_schedule_initial_ssh_refresh so setup is not blocked.
+                await self._async_refresh_ssh_data()
             self._async_schedule_app_version_refresh()
-            return self._build_update_data()
+            return self._refresh_update_data()
 
     async def _async_reauthenticate_client(self, original_error: Exception) -> None:
-        """Reauthenticate and replace the client when token/auth fails."""
-        options = api_connection_options(
-            self.config_entry.data[CONF_HOST],
+        """Reauthenticate when token/auth fails, replacing the client if needed."""
+        current_url = str(self.client.url)
+        options = self.connection_target.api_connection_options(
             self.config_entry.data.get(CONF_SSL_FINGERPRINT),
-            preferred_url=str(self.client.url),
+            preferred_url=current_url,
         )
         last_error: Exception | None = None
 
         for index, option in enumerate(options):
-            new_client = NanoKVMClient(
-                option.base_url,
-                ssl_fingerprint=option.ssl_fingerprint,
-            )
             try:
-                async with new_client:
-                    await new_client.authenticate(self.username, self.password)
-                self.client = new_client
+                if option.base_url == current_url:
+                    # Refresh the token on the live client rather than
+                    # rebuilding it; only alternate transports need a new one.
+                    await self.client.authenticate(self.username, self.password)
+                    return
+                new_client = await async_create_api_client(self.hass, option)
+                await new_client.authenticate(self.username, self.password)
+                await self._async_replace_client(new_client)
                 return
             except (aiohttp.ClientResponseError, NanoKVMAuthenticationFailure) as auth_err:
                 if _is_auth_failure(auth_err):
@@ -278,8 +345,7 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _async_failover_client(self, original_error: Exception) -> bool:
         """Switch to an alternate API transport after a connection failure."""
-        options = api_connection_options(
-            self.config_entry.data[CONF_HOST],
+        options = self.connection_target.api_connection_options(
             self.config_entry.data.get(CONF_SSL_FINGERPRINT),
             preferred_url=str(self.client.url),
         )
@@ -288,19 +354,15 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
         )
 
         for option in fallback_options:
-            new_client = NanoKVMClient(
-                option.base_url,
-                ssl_fingerprint=option.ssl_fingerprint,
-            )
             try:
-                async with new_client:
-                    await new_client.authenticate(self.username, self.password)
+                new_client = await async_create_api_client(self.hass, option)
+                await new_client.authenticate(self.username, self.password)
                 _LOGGER.debug(
                     "Switched NanoKVM API transport from %s to %s after connection failure",
                     self.client.url,
                     option.base_url,
                 )
-                self.client = new_client
+                await self._async_replace_client(new_client)
                 return True
             except NanoKVMAuthenticationFailure as err:
                 raise ConfigEntryAuthFailed(
@@ -325,10 +387,40 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
         )
         return False
 
-    async def _fetch_optional(self, endpoint: str, call):
-        """Run an optional endpoint call; return None when the device lacks it."""
+    async def _async_replace_client(self, new_client: NanoKVMClient) -> None:
+        """Swap in a new client and release the previous one."""
+        old_client = self.client
+        self.client = new_client
+        self._device_registry_info = None
+        await old_client.__aexit__(None, None, None)
+
+    async def _limited(self, call: Awaitable[_T]) -> _T:
+        """Await a device API request while holding one of the request slots."""
+        async with self._request_slots:
+            return await call
+
+    async def _fetch_optional(self, endpoint: str, call, *, supported: bool = True):
+        """Run an optional endpoint call; return None when the device lacks it.
+
+        Optional calls get their own timeout so one slow endpoint cannot use up
+        the budget shared by the rest of the poll.
+        """
+        if not supported:
+            return None
+
         try:
-            return await call()
+            # Time only the request itself, not the wait for a request slot.
+            async with self._request_slots, asyncio.timeout(
+                _OPTIONAL_REQUEST_TIMEOUT_SECONDS
+            ):
+                return await call()
+        except TimeoutError:
+            _LOGGER.debug(
+                "NanoKVM optional endpoint %s timed out after %ss",
+                endpoint,
+                _OPTIONAL_REQUEST_TIMEOUT_SECONDS,
+            )
+            return None
         except NanoKVMNotSupportedError as err:
             _LOGGER.debug(
                 "NanoKVM endpoint %s is not supported on this device: %s",
@@ -352,7 +444,7 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
     async def _fetch_oled_info(self):
         """Fetch OLED state, treating NanoKVM Pro's missing OLED file as unavailable."""
         try:
-            return await self.client.get_oled_info()
+            return await self._limited(self.client.get_oled_info())
         except NanoKVMApiError as err:
             if not _is_invalid_file_content_error(err):
                 raise
@@ -364,36 +456,91 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _async_fetch_core_data(self) -> None:
         """Fetch required API data used by entities."""
-        self.device_info = await self.client.get_info()
-        self.hostname_info = await self.client.get_hostname()
-        self.hardware_info = await self.client.get_hardware()
-        self.gpio_info = await self.client.get_gpio()
-        if self.hardware_info is not None:
-            self.virtual_device_info = await self._fetch_optional(
-                "/vm/device/virtual", self.client.get_virtual_device_status
-            )
-        else:
-            self.virtual_device_info = None
-        self.ssh_state = await self.client.get_ssh_state()
-        self.mdns_state = await self.client.get_mdns_state()
-        self.hid_mode = await self.client.get_hid_mode()
-        self.oled_info = await self._fetch_oled_info()
-        self.wifi_status = await self.client.get_wifi_status()
-        if self.supports_hdmi_endpoint:
-            self.hdmi_state = await self._fetch_optional(
-                "/vm/hdmi", self.client.get_hdmi_state
-            )
-        else:
-            self.hdmi_state = None
-        self.mouse_jiggler_state = await self.client.get_mouse_jiggler_state()
-        if self.supports_swap_size:
-            self.swap_size = await self._fetch_optional(
-                "/vm/swap", self.client.get_swap_size
+        calls = [self._async_fetch_frequent_data()]
+        if self._slow_data_due():
+            calls.append(self._async_fetch_slow_data())
+        await _gather_api_calls(*calls)
+        # Built once here so entity device_info reads never format strings.
+        self._device_registry_info = self._build_device_registry_info()
+
+        # These endpoints are gated on the hardware version fetched above.
+        self.virtual_device_info, self.hdmi_state, _ = (
+            await _gather_api_calls(
+                self._fetch_optional(
+                    "/vm/device/virtual",
+                    self.client.get_virtual_device_status,
+                    supported=self.hardware_info is not None,
+                ),
+                self._fetch_optional(
+                    "/vm/hdmi",
+                    self.client.get_hdmi_state,
+                    supported=self.supports_hdmi_endpoint,
+                ),
+                self._async_fetch_pro_data(),
             )
-        else:
-            self.swap_size = None
-        self.tailscale_status = await self.client.get_tailscale_status()
-        await self._async_fetch_pro_data()
+        )
+
+    async def _async_fetch_frequent_data(self) -> None:
+        """Fetch state that can change between any two polls."""
+        (
+            self.device_info,
+            self.gpio_info,
+            self.ssh_state,
+            self.wifi_status,
+            self.mouse_jiggler_state,
+        ) = await _gather_api_calls(
+            self._limited(self.client.get_info()),
+            self._limited(self.client.get_gpio()),
+            self._limited(self.client.get_ssh_state()),
+            self._limited(self.client.get_wifi_status()),
+            self._limited(self.client.get_mouse_jiggler_state()),
+        )
+        self.device_key = str(self.device_info.device_key)
+
+    async def _async_fetch_slow_data(self) -> None:
+        """Fetch rarely-changing configuration state."""
+        (
+            self.hostname_info,
+            self.hardware_info,
+            self.mdns_state,
+            self.hid_mode,
+            self.oled_info,
+            self.tailscale_status,
+        ) = await _gather_api_calls(
+            self._limited(self.client.get_hostname()),
+            self._limited(self.client.get_hardware()),
+            self._limited(self.client.get_mdns_state()),
+            self._limited(self.client.get_hid_mode()),
+            self._fetch_oled_info(),
+            self._fetch_optional(
+                "/extensions/tailscale/status", self.client.get_tailscale_status
+            ),
+        )
+        self.swap_size = await self._fetch_optional(
+            "/vm/swap",
+            self.client.get_swap_size,
+            supported=self.supports_swap_size,
+        )
+        self._slow_data_last_fetched = datetime.datetime.now(datetime.UTC)
+
+    def _slow_data_due(self) -> bool:
+        """Return whether rarely-changing state should be fetched this poll."""
+        return (
+            self._slow_data_last_fetched is None
+            or (
+                datetime.datetime.now(datetime.UTC) - self._slow_data_last_fetched
+            ).total_seconds()
+            >= _SLOW_DATA_REFRESH_SECONDS
+        )
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh that also re-reads rarely-changing state.
+
+        Entities request a refresh after changing device settings, so the next
+        poll must not serve cached configuration state.
+        """
+        self._slow_data_last_fetched = None
+        await super().async_request_refresh()
 
     async def _async_fetch_pro_data(self) -> None:
         """Fetch optional NanoKVM Pro state used by entities."""
@@ -401,26 +548,26 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
             self._clear_pro_data()
             return
 
-        self.hdmi_capture = await self._fetch_optional(
-            "/vm/hdmi/capture", self.client.get_hdmi_capture
-        )
-        self.hdmi_passthrough = await self._fetch_optional(
-            "/vm/hdmi/passthrough", self.client.get_hdmi_passthrough
-        )
-        self.low_power = await self._fetch_optional(
-            "/vm/low-power", self.client.get_low_power
-        )
-        self.led_strip = await self._fetch_optional(
-            "/vm/ledstrip/get", self.client.get_led_strip
-        )
-        self.lcd_time_format = await self._fetch_optional(
-            "/vm/lcd/time/format", self.client.get_lcd_time_format
-        )
-        self.time_status = await self._fetch_optional(
-            "/vm/time/status", self.client.get_time_status
-        )
-        self.static_ip = await self._fetch_optional(
-            "/network/static-ip", self.client.get_static_ip
+        (
+            self.hdmi_capture,
+            self.hdmi_passthrough,
+            self.low_power,
+            self.led_strip,
+            self.lcd_time_format,
+            self.time_status,
+            self.static_ip,
+        ) = await _gather_api_calls(
+            self._fetch_optional("/vm/hdmi/capture", self.client.get_hdmi_capture),
+            self._fetch_optional(
+                "/vm/hdmi/passthrough", self.client.get_hdmi_passthrough
+            ),
+            self._fetch_optional("/vm/low-power", self.client.get_low_power),
+            self._fetch_optional("/vm/ledstrip/get", self.client.get_led_strip),
+            self._fetch_optional(
+                "/vm/lcd/time/format", self.client.get_lcd_time_format
+            ),
+            self._fetch_optional("/vm/time/status", self.client.get_time_status),
+            self._fetch_optional("/network/static-ip", self.client.get_static_ip),
         )
 
     def _clear_pro_data(self) -> None:
@@ -475,6 +622,7 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
             token=self.client.token,
             ssl_fingerprint=self.config_entry.data.get(CONF_SSL_FINGERPRINT),
             request_timeout=_APP_VERSION_REQUEST_TIMEOUT_SECONDS,
+            session=async_get_clientsession(self.hass),
         )
         try:
             async with version_client:
@@ -490,28 +638,10 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
     async def _async_fetch_storage_data(self) -> None:
         """Fetch storage-specific state (mounted image and CD-ROM mode)."""
         if self.hid_mode and self.hid_mode.mode == HidMode.NORMAL:
-            try:
-                self.mounted_image = await self.client.get_mounted_image()
-            except NanoKVMApiError as err:
-                _LOGGER.debug(
-                    "Failed to get mounted image, retrieving default value: %s", err
-                )
-                self.mounted_image = GetMountedImageRsp(
-                    file="", cdrom=False, read_only=False
-                )
-
-            if self.supports_cdrom_endpoint:
-                try:
-                    self.cdrom_status = await self._fetch_optional(
-                        "/storage/cdrom", self.client.get_cdrom_status
-                    )
-                except NanoKVMApiError as err:
-                    _LOGGER.debug(
-                        "Failed to get CD-ROM status, retrieving default value: %s", err
-                    )
-                    self.cdrom_status = GetCdRomRsp(cdrom=0)
-            else:
-                self.cdrom_status = None
+            self.mounted_image, self.cdrom_status = await _gather_api_calls(
+                self._fetch_mounted_image(),
+                self._fetch_cdrom_status(),
+            )
         else:
             self.mounted_image = GetMountedImageRsp(
                 file="", cdrom=False, read_only=False
@@ -520,52 +650,186 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
                 GetCdRomRsp(cdrom=0) if self.supports_cdrom_endpoint else None
             )
 
+    async def _fetch_mounted_image(self) -> GetMountedImageRsp:
+        """Fetch the mounted image, falling back to an empty image on API errors."""
+        try:
+            return await self._limited(self.client.get_mounted_image())
+        except NanoKVMApiError as err:
+            _LOGGER.debug(
+                "Failed to get mounted image, retrieving default value: %s", err
+            )
+            return GetMountedImageRsp(file="", cdrom=False, read_only=False)
+
+    async def _fetch_cdrom_status(self) -> GetCdRomRsp | None:
+        """Fetch CD-ROM mode, falling back to disabled on API errors."""
+        if not self.supports_cdrom_endpoint:
+            return None
+
+        try:
+            return await self._fetch_optional(
+                "/storage/cdrom", self.client.get_cdrom_status
+            )
+        except NanoKVMApiError as err:
+            _LOGGER.debug(
+                "Failed to get CD-ROM status, retrieving default value: %s", err
+            )
+            return GetCdRomRsp(cdrom=0)
+
+    @callback
+    def async_schedule_initial_ssh_refresh(self) -> None:
+        """Collect the first SSH metrics in the background after platform setup."""
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_initial_ssh_refresh(),
+            "nanokvm-ssh-first-refresh",
+        )
+
+    async def _async_initial_ssh_refresh(self) -> None:
+        """Run the deferred first SSH refresh and notify entities."""
+        try:
+            async with asyncio.timeout(_UPDATE_TIMEOUT_SECONDS):
+                await self._async_refresh_ssh_data()
+        except TimeoutError:
+            # The cancelled command may have left the session half-open; drop it
+            # so the next poll reconnects from scratch.
+            _LOGGER.debug("Timed out collecting initial SSH metrics")
+            async with self._ssh_collector_lock:
+                await self._async_clear_ssh_data()
+        self.async_update_listeners()
+
     async def _async_refresh_ssh_data(self) -> None:
         """Fetch or clear SSH metrics depending on SSH state."""
-        if self.ssh_state and self.ssh_state.enabled:
-            await self._async_update_ssh_data()
-        else:
-            await self._async_clear_ssh_data()
+        async with self._ssh_collector_lock:
+            if (
+                self.ssh_state
+                and self.ssh_state.enabled
+                and self._ssh_metrics_requested()
+            ):
+                await self._async_update_ssh_data()
+            else:
+                await self._async_clear_ssh_data()
+
+    def _ssh_metrics_requested(self) -> bool:
+        """Return whether SSH metrics are needed by current or pending entities."""
+        # Collect until the SSH-backed entities exist so they can be created;
+        # afterwards only while at least one of them is listening.
+        if not self.ssh_sensors_created or (
+            self.supports_watchdog and not self.ssh_switches_created
+        ):
+            return True
+        return COORDINATOR_CONTEXT_SSH in self.async_contexts()
 
-    def _build_update_data(self) -> dict[str, Any]:
-        """Build coordinator data payload for entities."""
-        return {
-            "device_info": self.device_info,
-            "hardware_info": self.hardware_info,
-            "gpio_info": self.gpio_info,
-            "virtual_device_info": self.virtual_device_info,
-            "ssh_state": self.ssh_state,
-            "mdns_state": self.mdns_state,
-            "hid_mode": self.hid_mode,
-            "oled_info": self.oled_info,
-            "wifi_status": self.wifi_status,
-            "application_version_info": self.application_version_info,
-            "mounted_image": self.mounted_image,
-            "cdrom_status": self.cdrom_status,
-            "mouse_jiggler_state": self.mouse_jiggler_state,
-            "hdmi_state": self.hdmi_state,
-            "hdmi_capture": self.hdmi_capture,
-            "hdmi_passthrough": self.hdmi_passthrough,
-            "low_power": self.low_power,
-            "led_strip": self.led_strip,
-            "lcd_time_format": self.lcd_time_format,
-            "time_status": self.time_status,
-            "static_ip": self.static_ip,
-            "swap_size": self.swap_size,
-            "tailscale_status": self.tailscale_status,
-            "hostname_info": self.hostname_info,
-            "watchdog_enabled": self.watchdog_enabled,
-        }
+    @callback
+    def async_apply_local_update(
+        self, update_fn: Callable[..., None], *args: Any
+    ) -> None:
+        """Apply a confirmed state change locally and publish the rebuilt payload."""
+        update_fn(self, *args)
+        self.async_set_updated_data(self._refresh_update_data())
+
+    def _refresh_update_data(self) -> dict[str, Any]:
+        """Refresh the coordinator data payload in place and return it."""
+        data = self._data
+        data["device_info"] = self.device_info
+        data["hardware_info"] = self.hardware_info
+        data["gpio_info"] = self.gpio_info
+        data["virtual_device_info"] = self.virtual_device_info
+        data["ssh_state"] = self.ssh_state
+        data["mdns_state"] = self.mdns_state
+        data["hid_mode"] = self.hid_mode
+        data["oled_info"] = self.oled_info
+        data["wifi_status"] = self.wifi_status
+        data["application_version_info"] = self.application_version_info
+        data["mounted_image"] = self.mounted_image
+        data["cdrom_status"] = self.cdrom_status
+        data["mouse_jiggler_state"] = self.mouse_jiggler_state
+        data["hdmi_state"] = self.hdmi_state
+        data["hdmi_capture"] = self.hdmi_capture
+        data["hdmi_passthrough"] = self.hdmi_passthrough
+        data["low_power"] = self.low_power
+        data["led_strip"] = self.led_strip
+        data["lcd_time_format"] = self.lcd_time_format
+        data["time_status"] = self.time_status
+        data["static_ip"] = self.static_ip
+        data["swap_size"] = self.swap_size
+        data["tailscale_status"] = self.tailscale_status
+        data["hostname_info"] = self.hostname_info
+        data["watchdog_enabled"] = self.watchdog_enabled
+        return data
 
     def _clear_ssh_runtime_state(self) -> None:
         """Clear SSH-derived runtime state from the coordinator."""
-        self.uptime = None
-        self.cpu_temperature = None
-        self.memory_total = None
-        self.memory_used_percent = None
-        self.storage_total = None
-        self.storage_used_percent = None
-        self.watchdog_enabled = None
+        self.ssh_metrics = None
+
+    @property
+    def uptime(self) -> datetime.datetime | None:
+        """Return the boot time collected over SSH."""
+        return self.ssh_metrics.uptime if self.ssh_metrics else None
+
+    @property
+    def cpu_temperature(self) -> float | None:
+        """Return the CPU temperature collected over SSH."""
+        return self.ssh_metrics.cpu_temperature if self.ssh_metrics else None
+
+    @property
+    def memory_total(self) -> float | None:
+        """Return total memory in MB collected over SSH."""
+        return self.ssh_metrics.memory_total if self.ssh_metrics else None
+
+    @property
+    def memory_used_percent(self) -> float | None:
+        """Return used memory percentage collected over SSH."""
+        return self.ssh_metrics.memory_used_percent if self.ssh_metrics else None
+
+    @property
+    def storage_total(self) -> float | None:
+        """Return total root storage in MB collected over SSH."""
+        return self.ssh_metrics.storage_total if self.ssh_metrics else None
+
+    @property
+    def storage_used_percent(self) -> float | None:
+        """Return used root storage percentage collected over SSH."""
+        return self.ssh_metrics.storage_used_percent if self.ssh_metrics else None
+
+    @property
+    def watchdog_enabled(self) -> bool | None:
+        """Return whether the watchdog is enabled, as read over SSH."""
+        return self.ssh_metrics.watchdog_enabled if self.ssh_metrics else None
+
+    @property
+    def device_registry_info(self) -> DeviceInfo:
+        """Return device registry information built during the last poll."""
+        if self._device_registry_info is None:
+            self._device_registry_info = self._build_device_registry_info()
+        return self._device_registry_info
+
+    def _build_device_registry_info(self) -> DeviceInfo:
+        """Build device registry information from the latest device state."""
+        hostname = (
+            self.hostname_info.hostname
+            if self.hostname_info is not None
+            else INTEGRATION_TITLE
+        )
+        hw_version = (
+            self.hardware_info.version.value
+            if self.hardware_info is not None
+            else "Unknown"
+        )
+
+        sw_version = self.device_info.application
+        image = getattr(self.device_info, "image", None)
+        if image:
+            sw_version += f" (Image: {image})"
+
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.device_key)},
+            name=hostname,
+            manufacturer="Sipeed",
+            model=f"{INTEGRATION_TITLE} {hw_version}",
+            sw_version=sw_version,
+            hw_version=hw_version,
+            configuration_url=api_base_url_to_web_url(str(self.client.url)),
+        )
 
     @property
     def supports_watchdog(self) -> bool:
@@ -622,9 +886,19 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_ensure_ssh_metrics_collector(self) -> SSHMetricsCollector:
         """Return the active SSH collector, creating it when needed."""
+        async with self._ssh_collector_lock:
+            return await self._async_ensure_ssh_metrics_collector()
+
+    async def _async_ensure_ssh_metrics_collector(self) -> SSHMetricsCollector:
+        """Return the SSH collector; the caller must hold the collector lock."""
         if not self.ssh_metrics_collector:
-            host = extract_ssh_host(self.config_entry.data[CONF_HOST])
-            self.ssh_metrics_collector = SSHMetricsCollector(host=host, password=self.password)
+            # Imported on first use so installs without SSH never load paramiko.
+            ssh_metrics = await async_import_module(
+                self.hass, f"{__package__}.ssh_metrics"
+            )
+            self.ssh_metrics_collector = ssh_metrics.SSHMetricsCollector(
+                host=self.connection_target.ssh_host, password=self.password
+            )
         return self.ssh_metrics_collector
 
     def _async_maybe_create_media_entities(self) -> None:
@@ -659,22 +933,18 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
     async def _async_update_ssh_data(self) -> None:
         """Fetch data via SSH."""
         try:
-            collector = await self.async_ensure_ssh_metrics_collector()
-            metrics = await collector.collect(include_watchdog=self.supports_watchdog)
-            self.uptime = metrics.uptime
-            self.cpu_temperature = metrics.cpu_temperature
-            self.memory_total = metrics.memory_total
-            self.memory_used_percent = metrics.memory_used_percent
-            self.storage_total = metrics.storage_total
-            self.storage_used_percent = metrics.storage_used_percent
-            self.watchdog_enabled = metrics.watchdog_enabled
-            _LOGGER.debug(
-                "SSH coordinator metrics updated: uptime=%s cpu_temperature=%s memory_used_percent=%s storage_used_percent=%s",
-                self.uptime,
-                self.cpu_temperature,
-                self.memory_used_percent,
-                self.storage_used_percent,
+            collector = await self._async_ensure_ssh_metrics_collector()
+            self.ssh_metrics = await collector.collect(
+                include_watchdog=self.supports_watchdog
             )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "SSH coordinator metrics updated: uptime=%s cpu_temperature=%s memory_used_percent=%s storage_used_percent=%s",
+                    self.uptime,
+                    self.cpu_temperature,
+                    self.memory_used_percent,
+                    self.storage_used_percent,
+                )
 
             if not self.ssh_sensors_created:
                 _LOGGER.debug("SSH enabled, signaling to create SSH sensors")
@@ -691,13 +961,13 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
                 self.ssh_switches_created = True
 
         except Exception as err:
+            # The collector drops its own session on transport failures, so a
+            # malformed reading keeps the persistent connection for next poll.
             _LOGGER.debug("Failed to fetch data via SSH: %s", err)
             self._clear_ssh_runtime_state()
-            if self.ssh_metrics_collector:
-                await self.ssh_metrics_collector.disconnect()
 
     async def _async_clear_ssh_data(self) -> None:
-        """Clear SSH data and disconnect client."""
+        """Clear SSH data and disconnect; the caller must hold the collector lock."""
         self._clear_ssh_runtime_state()
         if self.ssh_metrics_collector:
             await self.ssh_metrics_collector.disconnect()
@@ -711,6 +981,11 @@ class NanoKVMDataUpdateCoordinator(DataUpdateCoordinator):
                 await self._app_version_fetch_task
             self._app_version_fetch_task = None
 
-        if self.ssh_metrics_collector:
-            await self.ssh_metrics_collector.disconnect()
-            self.ssh_metrics_collector = None
+        async with self._ssh_collector_lock:
+            if self.ssh_metrics_collector:
+                await self.ssh_metrics_collector.disconnect()
+                self.ssh_metrics_collector = None
+
+        if not self._client_released:
+            self._client_released = True
+            await self.client.__aexit__(None, None, None)
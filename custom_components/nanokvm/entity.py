@@ -4,15 +4,34 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, INTEGRATION_TITLE
 from .coordinator import NanoKVMDataUpdateCoordinator
-from .utils import api_base_url_to_web_url
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def always_available(coordinator: NanoKVMDataUpdateCoordinator) -> bool:
+    """Return True; default `available_fn` for entity descriptions."""
+    return True
+
+
+def always_create(coordinator: NanoKVMDataUpdateCoordinator) -> bool:
+    """Return True; default `should_create_fn` for entity descriptions."""
+    return True
+
+
+def always_false(coordinator: NanoKVMDataUpdateCoordinator) -> bool:
+    """Return False; default `value_fn` for boolean entity descriptions."""
+    return False
+
+
+def no_value(coordinator: NanoKVMDataUpdateCoordinator) -> None:
+    """Return None; default `value_fn` for entity descriptions."""
+    return None
+
+
 class NanoKVMEntity(CoordinatorEntity[NanoKVMDataUpdateCoordinator]):
     """Base class for NanoKVM entities."""
 
@@ -23,42 +42,24 @@ class NanoKVMEntity(CoordinatorEntity[NanoKVMDataUpdateCoordinator]):
         coordinator: NanoKVMDataUpdateCoordinator,
         unique_id_suffix: str,
         name: str | None = None,
+        context: Any = None,
     ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context)
         if name is not None:
             self._attr_name = name
-        self._attr_unique_id = f"{coordinator.device_info.device_key}_{unique_id_suffix}"
-        _LOGGER.debug(
-            "Created entity %s with unique_id: %s", unique_id_suffix, self._attr_unique_id
-        )
+        # Platforms are only set up after a successful first refresh, so a
+        # missing key means a real device identity was never fetched.
+        assert coordinator.device_key is not None
+        self._attr_unique_id = f"{coordinator.device_key}_{unique_id_suffix}"
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Created entity %s with unique_id: %s",
+                unique_id_suffix,
+                self._attr_unique_id,
+            )
 
     @property
-    def device_info(self) -> dict[str, Any]:
+    def device_info(self) -> DeviceInfo:
         """Return device information about this NanoKVM device."""
-        device_data = self.coordinator.device_info
-        hostname = (
-            self.coordinator.hostname_info.hostname
-            if self.coordinator.hostname_info is not None
-            else INTEGRATION_TITLE
-        )
-        hw_version = (
-            self.coordinator.hardware_info.version.value
-            if self.coordinator.hardware_info is not None
-            else "Unknown"
-        )
-
-        sw_version = device_data.application
-        image = getattr(device_data, "image", None)
-        if image:
-            sw_version += f" (Image: {image})"
-
-        return {
-            "identifiers": {(DOMAIN, device_data.device_key)},
-            "name": hostname,
-            "manufacturer": "Sipeed",
-            "model": f"{INTEGRATION_TITLE} {hw_version}",
-            "sw_version": sw_version,
-            "hw_version": hw_version,
-            "configuration_url": api_base_url_to_web_url(str(self.coordinator.client.url)),
-        }
+        return self.coordinator.device_registry_info
@@ -25,7 +25,7 @@ from .const import (
     LED_BRIGHTNESS_MIN,
 )
 from .coordinator import NanoKVMDataUpdateCoordinator
-from .entity import NanoKVMEntity
+from .entity import NanoKVMEntity, always_available, no_value
 from .led import build_led_strip_config, max_horizontal_count, max_vertical_count
 
 
@@ -33,17 +33,12 @@ from .led import build_led_strip_config, max_horizontal_count, max_vertical_coun
 class NanoKVMNumberEntityDescription(NumberEntityDescription):
     """Describes NanoKVM number entity."""
 
-    value_fn: Callable[[NanoKVMDataUpdateCoordinator], float | None] = lambda _: None
-    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
-    min_value_fn: Callable[[NanoKVMDataUpdateCoordinator], float] = (
-        lambda _: LED_BEAD_MIN
-    )
-    max_value_fn: Callable[[NanoKVMDataUpdateCoordinator], float] = (
-        lambda _: LED_BEAD_TOTAL_LIMIT
-    )
-    set_value_fn: Callable[
-        [NanoKVMDataUpdateCoordinator, float], Awaitable[Any]
-    ] | None = None
+    value_fn: Callable[[NanoKVMDataUpdateCoordinator], float | None] = no_value
+    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = always_available
+    # None keeps the static native_min_value/native_max_value bounds.
+    min_value_fn: Callable[[NanoKVMDataUpdateCoordinator], float] | None = None
+    max_value_fn: Callable[[NanoKVMDataUpdateCoordinator], float] | None = None
+    set_value_fn: Callable[[NanoKVMDataUpdateCoordinator, float], Awaitable[Any]]
 
 
 def _has_led_strip(coordinator: NanoKVMDataUpdateCoordinator) -> bool:
@@ -145,8 +140,6 @@ NUMBERS: tuple[NanoKVMNumberEntityDescription, ...] = (
         mode=NumberMode.SLIDER,
         value_fn=_led_brightness_value,
         available_fn=_has_led_strip,
-        min_value_fn=lambda _: LED_BRIGHTNESS_MIN,
-        max_value_fn=lambda _: LED_BRIGHTNESS_MAX,
         set_value_fn=_set_led_brightness,
     ),
     NanoKVMNumberEntityDescription(
@@ -161,7 +154,6 @@ NUMBERS: tuple[NanoKVMNumberEntityDescription, ...] = (
         mode=NumberMode.BOX,
         value_fn=_led_horizontal_value,
         available_fn=_has_led_strip,
-        min_value_fn=lambda _: LED_BEAD_MIN,
         max_value_fn=_led_horizontal_max,
         set_value_fn=_set_led_horizontal_count,
     ),
@@ -177,7 +169,6 @@ NUMBERS: tuple[NanoKVMNumberEntityDescription, ...] = (
         mode=NumberMode.BOX,
         value_fn=_led_vertical_value,
         available_fn=_has_led_strip,
-        min_value_fn=lambda _: LED_BEAD_MIN,
         max_value_fn=_led_vertical_max,
         set_value_fn=_set_led_vertical_count,
     ),
@@ -234,23 +225,21 @@ class NanoKVMNumber(NanoKVMEntity, NumberEntity):
     @property
     def native_min_value(self) -> float:
         """Return the dynamic minimum value."""
-        return self.entity_description.min_value_fn(self.coordinator)
+        if (min_value_fn := self.entity_description.min_value_fn) is None:
+            return super().native_min_value
+        return min_value_fn(self.coordinator)
 
     @property
     def native_max_value(self) -> float:
         """Return the dynamic maximum value."""
-        return self.entity_description.max_value_fn(self.coordinator)
+        if (max_value_fn := self.entity_description.max_value_fn) is None:
+            return super().native_max_value
+        return max_value_fn(self.coordinator)
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the number value."""
-        if self.entity_description.set_value_fn is None:
-            raise RuntimeError(
-                f"Missing number handler for number: {self.entity_description.key}"
-            )
-
         try:
-            async with self.coordinator.client:
-                await self.entity_description.set_value_fn(self.coordinator, value)
+            await self.entity_description.set_value_fn(self.coordinator, value)
         except ValueError as err:
             raise HomeAssistantError(str(err)) from err
 
@@ -21,18 +21,26 @@ from .const import (
     ICON_OLED,
 )
 from .coordinator import NanoKVMDataUpdateCoordinator
-from .entity import NanoKVMEntity
+from .entity import NanoKVMEntity, always_available
+
+
+def _empty_value(coordinator: NanoKVMDataUpdateCoordinator) -> str:
+    """Return the default empty option."""
+    return ""
 
 
 @dataclass(frozen=True, kw_only=True)
 class NanoKVMSelectEntityDescription(SelectEntityDescription):
     """Describes NanoKVM select entity."""
 
-    value_fn: Callable[[NanoKVMDataUpdateCoordinator], str | None] = lambda _: ""
-    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
+    value_fn: Callable[[NanoKVMDataUpdateCoordinator], str | None] = _empty_value
+    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = always_available
     options_fn: Callable[[NanoKVMDataUpdateCoordinator], list[str]] | None = None
-    select_option_fn: Callable[
-        [NanoKVMDataUpdateCoordinator, str], Awaitable[Any]
+    select_option_fn: Callable[[NanoKVMDataUpdateCoordinator, str], Awaitable[Any]]
+    # Applies a successful selection to coordinator state; selects without
+    # one fall back to a full refresh.
+    coordinator_update_fn: Callable[
+        [NanoKVMDataUpdateCoordinator, str], None
     ] | None = None
 
 
@@ -149,9 +157,25 @@ def _set_mouse_jiggler_mode(
     coordinator: NanoKVMDataUpdateCoordinator, option: str
 ) -> Awaitable[Any]:
     """Set mouse jiggler state from option key."""
+    mode = MOUSE_JIGGLER_OPTIONS.get(option)
     return coordinator.client.set_mouse_jiggler_state(
-        MOUSE_JIGGLER_OPTIONS.get(option) is not None,
-        MOUSE_JIGGLER_OPTIONS.get(option) or MouseJigglerMode.ABSOLUTE,
+        mode is not None,
+        mode or MouseJigglerMode.ABSOLUTE,
+    )
+
+
+def _update_mouse_jiggler_mode(
+    coordinator: NanoKVMDataUpdateCoordinator, option: str
+) -> None:
+    """Apply a selected mouse jiggler option to coordinator state."""
+    if coordinator.mouse_jiggler_state is None:
+        return
+    mode = MOUSE_JIGGLER_OPTIONS.get(option)
+    coordinator.mouse_jiggler_state = coordinator.mouse_jiggler_state.model_copy(
+        update={
+            "enabled": mode is not None,
+            "mode": mode or MouseJigglerMode.ABSOLUTE,
+        }
     )
 
 
@@ -159,7 +183,9 @@ def _oled_sleep_value(coordinator: NanoKVMDataUpdateCoordinator) -> str:
     """Return current OLED sleep option."""
     if coordinator.oled_info is None:
         return "never"
-    return OLED_SLEEP_VALUES.get(coordinator.oled_info.sleep, f"{coordinator.oled_info.sleep}_sec")
+    if (option := OLED_SLEEP_VALUES.get(coordinator.oled_info.sleep)) is not None:
+        return option
+    return f"{coordinator.oled_info.sleep}_sec"
 
 
 def _set_oled_sleep(
@@ -169,11 +195,24 @@ def _set_oled_sleep(
     return coordinator.client.set_oled_sleep(OLED_SLEEP_OPTIONS.get(option, 0))
 
 
+def _update_oled_sleep(
+    coordinator: NanoKVMDataUpdateCoordinator, option: str
+) -> None:
+    """Apply a selected OLED sleep timeout to coordinator state."""
+    if coordinator.oled_info is None:
+        return
+    coordinator.oled_info = coordinator.oled_info.model_copy(
+        update={"sleep": OLED_SLEEP_OPTIONS.get(option, 0)}
+    )
+
+
 def _swap_size_value(coordinator: NanoKVMDataUpdateCoordinator) -> str:
     """Return current swap size option."""
     if coordinator.swap_size is None:
         return "disable"
-    return SWAP_VALUES.get(coordinator.swap_size, f"{coordinator.swap_size}_mb")
+    if (option := SWAP_VALUES.get(coordinator.swap_size)) is not None:
+        return option
+    return f"{coordinator.swap_size}_mb"
 
 
 def _set_swap_size(
@@ -183,6 +222,13 @@ def _set_swap_size(
     return coordinator.client.set_swap_size(SWAP_OPTIONS.get(option, 0))
 
 
+def _update_swap_size(
+    coordinator: NanoKVMDataUpdateCoordinator, option: str
+) -> None:
+    """Apply a selected swap size to coordinator state."""
+    coordinator.swap_size = SWAP_OPTIONS.get(option, 0)
+
+
 def _lcd_time_format_value(coordinator: NanoKVMDataUpdateCoordinator) -> str | None:
     """Return current LCD time format."""
     if coordinator.lcd_time_format is None:
@@ -199,6 +245,21 @@ def _set_lcd_time_format(
     )
 
 
+def _update_lcd_time_format(
+    coordinator: NanoKVMDataUpdateCoordinator, option: str
+) -> None:
+    """Apply a selected LCD time format to coordinator state."""
+    if coordinator.lcd_time_format is None:
+        return
+    coordinator.lcd_time_format = coordinator.lcd_time_format.model_copy(
+        update={
+            "format": LCD_TIME_FORMAT_OPTIONS.get(
+                option, LcdTimeFormat.TWENTY_FOUR_HOUR
+            )
+        }
+    )
+
+
 def _pro_disk_value(coordinator: NanoKVMDataUpdateCoordinator) -> str | None:
     """Return current Pro virtual disk type."""
     if coordinator.virtual_device_info is None:
@@ -227,7 +288,7 @@ SELECTS: tuple[NanoKVMSelectEntityDescription, ...] = (
         translation_key="hid_mode",
         icon=ICON_HID,
         entity_category=EntityCategory.CONFIG,
-        options=list(HID_MODE_OPTIONS.keys()),
+        options=list(HID_MODE_OPTIONS),
         value_fn=_hid_mode_value,
         select_option_fn=_set_hid_mode,
         available_fn=_has_hid_mode,
@@ -238,9 +299,10 @@ SELECTS: tuple[NanoKVMSelectEntityDescription, ...] = (
         translation_key="mouse_jiggler_mode",
         icon=ICON_MOUSE_JIGGLER,
         entity_category=EntityCategory.CONFIG,
-        options=list(MOUSE_JIGGLER_OPTIONS.keys()),
+        options=list(MOUSE_JIGGLER_OPTIONS),
         value_fn=_mouse_jiggler_mode_value,
         select_option_fn=_set_mouse_jiggler_mode,
+        coordinator_update_fn=_update_mouse_jiggler_mode,
         available_fn=_has_mouse_jiggler_state,
     ),
     NanoKVMSelectEntityDescription(
@@ -249,9 +311,10 @@ SELECTS: tuple[NanoKVMSelectEntityDescription, ...] = (
         translation_key="oled_sleep_timeout",
         icon=ICON_OLED,
         entity_category=EntityCategory.CONFIG,
-        options=list(OLED_SLEEP_OPTIONS.keys()),
+        options=list(OLED_SLEEP_OPTIONS),
         value_fn=_oled_sleep_value,
         select_option_fn=_set_oled_sleep,
+        coordinator_update_fn=_update_oled_sleep,
         available_fn=_has_oled,
     ),
     NanoKVMSelectEntityDescription(
@@ -260,9 +323,10 @@ SELECTS: tuple[NanoKVMSelectEntityDescription, ...] = (
         translation_key="swap_size",
         icon=ICON_DISK,
         entity_category=EntityCategory.CONFIG,
-        options=list(SWAP_OPTIONS.keys()),
+        options=list(SWAP_OPTIONS),
         value_fn=_swap_size_value,
         select_option_fn=_set_swap_size,
+        coordinator_update_fn=_update_swap_size,
         available_fn=_has_swap_size,
     ),
     NanoKVMSelectEntityDescription(
@@ -271,9 +335,10 @@ SELECTS: tuple[NanoKVMSelectEntityDescription, ...] = (
         translation_key="lcd_time_format",
         icon="mdi:clock-digital",
         entity_category=EntityCategory.CONFIG,
-        options=list(LCD_TIME_FORMAT_OPTIONS.keys()),
+        options=list(LCD_TIME_FORMAT_OPTIONS),
         value_fn=_lcd_time_format_value,
         select_option_fn=_set_lcd_time_format,
+        coordinator_update_fn=_update_lcd_time_format,
         available_fn=_has_lcd_time_format,
     ),
     NanoKVMSelectEntityDescription(
@@ -282,7 +347,7 @@ SELECTS: tuple[NanoKVMSelectEntityDescription, ...] = (
         translation_key="virtual_disk_type",
         icon=ICON_DISK,
         entity_category=EntityCategory.CONFIG,
-        options=list(DISK_TYPE_OPTIONS.keys()),
+        options=list(DISK_TYPE_OPTIONS),
         options_fn=_pro_disk_options,
         value_fn=_pro_disk_value,
         select_option_fn=_set_pro_disk,
@@ -340,8 +405,16 @@ class NanoKVMSelect(NanoKVMEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        if self.entity_description.select_option_fn is None:
-            raise RuntimeError(f"Missing select handler for select: {self.entity_description.key}")
-        async with self.coordinator.client:
+        try:
             await self.entity_description.select_option_fn(self.coordinator, option)
-        await self.coordinator.async_request_refresh()
+        except Exception:
+            await self.coordinator.async_request_refresh()
+            raise
+
+        if self.entity_description.coordinator_update_fn is None:
+            await self.coordinator.async_request_refresh()
+            return
+
+        self.coordinator.async_apply_local_update(
+            self.entity_description.coordinator_update_fn, option
+        )
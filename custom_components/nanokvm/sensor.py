@@ -20,6 +20,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import NanoKVMDataUpdateCoordinator
 from .const import (
+    COORDINATOR_CONTEXT_SSH,
     DOMAIN,
     ICON_DISK,
     ICON_IMAGE,
@@ -29,7 +30,7 @@ from .const import (
     ICON_SSH,
     SIGNAL_NEW_SSH_SENSORS,
 )
-from .entity import NanoKVMEntity
+from .entity import NanoKVMEntity, always_available, always_create, no_value
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -169,15 +170,23 @@ def _storage_total_attribute(coordinator: NanoKVMDataUpdateCoordinator) -> dict[
     return {"total_mb": coordinator.storage_total} if coordinator.storage_total is not None else {}
 
 
+def _no_attributes(coordinator: NanoKVMDataUpdateCoordinator) -> dict[str, Any]:
+    """Return no extra attributes for sensors without an attribute reader."""
+    return {}
+
+
 @dataclass(frozen=True, kw_only=True)
 class NanoKVMSensorEntityDescription(SensorEntityDescription):
     """Describes NanoKVM sensor entity."""
 
-    value_fn: Callable[[NanoKVMDataUpdateCoordinator], Any] = lambda _: None
-    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
-    should_create_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
-    attributes_fn: Callable[[NanoKVMDataUpdateCoordinator], dict[str, Any]] = lambda _: {}
+    value_fn: Callable[[NanoKVMDataUpdateCoordinator], Any] = no_value
+    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = always_available
+    should_create_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = always_create
+    attributes_fn: Callable[[NanoKVMDataUpdateCoordinator], dict[str, Any]] = (
+        _no_attributes
+    )
     connection_type: str | None = None
+    coordinator_context: str | None = None
 
 
 MEDIA_SENSORS: tuple[NanoKVMSensorEntityDescription, ...] = (
@@ -260,6 +269,7 @@ SSH_SENSORS: tuple[NanoKVMSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TIMESTAMP,
         value_fn=lambda coordinator: coordinator.uptime,
         available_fn=lambda coordinator: coordinator.uptime is not None,
+        coordinator_context=COORDINATOR_CONTEXT_SSH,
     ),
     NanoKVMSensorEntityDescription(
         key="cpu_temperature",
@@ -272,6 +282,7 @@ SSH_SENSORS: tuple[NanoKVMSensorEntityDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda coordinator: coordinator.cpu_temperature,
         available_fn=lambda coordinator: coordinator.cpu_temperature is not None,
+        coordinator_context=COORDINATOR_CONTEXT_SSH,
     ),
     NanoKVMSensorEntityDescription(
         key="memory_used_percent",
@@ -284,6 +295,7 @@ SSH_SENSORS: tuple[NanoKVMSensorEntityDescription, ...] = (
         value_fn=lambda coordinator: coordinator.memory_used_percent,
         available_fn=lambda coordinator: coordinator.memory_used_percent is not None,
         attributes_fn=_memory_total_attribute,
+        coordinator_context=COORDINATOR_CONTEXT_SSH,
     ),
     NanoKVMSensorEntityDescription(
         key="storage_used_percent",
@@ -296,6 +308,7 @@ SSH_SENSORS: tuple[NanoKVMSensorEntityDescription, ...] = (
         value_fn=lambda coordinator: coordinator.storage_used_percent,
         available_fn=lambda coordinator: coordinator.storage_used_percent is not None,
         attributes_fn=_storage_total_attribute,
+        coordinator_context=COORDINATOR_CONTEXT_SSH,
     ),
 )
 
@@ -427,6 +440,7 @@ class NanoKVMSensor(NanoKVMEntity, SensorEntity):
         super().__init__(
             coordinator=coordinator,
             unique_id_suffix=f"sensor_{description.key}",
+            context=description.coordinator_context,
         )
 
     @property
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Awaitable, Callable
 from typing import Any
 
 import voluptuous as vol
@@ -15,7 +14,6 @@ from homeassistant.core import (
 )
 from homeassistant.exceptions import HomeAssistantError
 
-from nanokvm.client import NanoKVMClient
 from nanokvm.models import GpioType, MouseJigglerMode
 
 from .const import (
@@ -98,12 +96,17 @@ WAKE_ON_LAN_SCHEMA = vol.Schema(
     }
 )
 
+_MOUSE_JIGGLER_MODES = {
+    mode.value: mode
+    for mode in (MouseJigglerMode.ABSOLUTE, MouseJigglerMode.RELATIVE)
+}
+
 SET_MOUSE_JIGGLER_SCHEMA = vol.Schema(
     _OPTIONAL_HOST_FIELD | {
         vol.Required(ATTR_ENABLED): bool,
         vol.Optional(
             ATTR_MODE, default=MouseJigglerMode.ABSOLUTE.value
-        ): vol.In([MouseJigglerMode.ABSOLUTE.value, MouseJigglerMode.RELATIVE.value]),
+        ): vol.In(list(_MOUSE_JIGGLER_MODES)),
     }
 )
 
@@ -138,6 +141,19 @@ def _model_to_response(value: Any) -> ServiceResponse:
     return {"value": value}
 
 
+def _coordinator_host(coordinator: NanoKVMDataUpdateCoordinator) -> str:
+    """Return the configured host of a coordinator for logs and errors."""
+    return coordinator.config_entry.data.get(CONF_HOST, "<unknown>")
+
+
+def _log_service_done(
+    coordinator: NanoKVMDataUpdateCoordinator, message: str, *args: Any
+) -> None:
+    """Debug-log a completed service call; the device host is the last argument."""
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(message, *args, _coordinator_host(coordinator))
+
+
 def _ensure_pro(coordinator: NanoKVMDataUpdateCoordinator, service_name: str) -> None:
     """Raise when a service requires NanoKVM Pro hardware."""
     if not coordinator.is_pro_hardware:
@@ -169,8 +185,7 @@ def async_register_services(hass: HomeAssistant) -> None:
         matches = [
             coordinator
             for coordinator in coordinators
-            if host_match_key(coordinator.config_entry.data[CONF_HOST])
-            == requested_host_key
+            if coordinator.connection_target.match_key == requested_host_key
         ]
 
         if not matches:
@@ -184,48 +199,21 @@ def async_register_services(hass: HomeAssistant) -> None:
         return matches[0]
 
     async def _execute_service(
-        call: ServiceCall,
+        coordinator: NanoKVMDataUpdateCoordinator,
         service_name: str,
-        handler: Callable[
-            [NanoKVMDataUpdateCoordinator, NanoKVMClient, str], Awaitable[None]
-        ],
-    ) -> None:
-        """Execute a service on the targeted NanoKVM device."""
-        coordinator = _resolve_target_coordinator(call)
+        method_name: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Call a client method on the targeted NanoKVM device."""
         client = coordinator.client
-        host = coordinator.config_entry.data.get(CONF_HOST, "<unknown>")
 
         try:
-            async with client:
-                await handler(coordinator, client, host)
-        except HomeAssistantError:
-            raise
-        except Exception as err:
-            _LOGGER.error(
-                "Error executing %s service for %s: %s", service_name, host, err
-            )
-            raise HomeAssistantError(
-                f"Failed to execute {service_name} for {host}: {err}"
-            ) from err
-
-    async def _execute_response_service(
-        call: ServiceCall,
-        service_name: str,
-        handler: Callable[
-            [NanoKVMDataUpdateCoordinator, NanoKVMClient, str], Awaitable[Any]
-        ],
-    ) -> ServiceResponse:
-        """Execute a response-returning service on the targeted NanoKVM device."""
-        coordinator = _resolve_target_coordinator(call)
-        client = coordinator.client
-        host = coordinator.config_entry.data.get(CONF_HOST, "<unknown>")
-
-        try:
-            async with client:
-                return _model_to_response(await handler(coordinator, client, host))
+            return await getattr(client, method_name)(*args, **kwargs)
         except HomeAssistantError:
             raise
         except Exception as err:
+            host = _coordinator_host(coordinator)
             _LOGGER.error(
                 "Error executing %s service for %s: %s", service_name, host, err
             )
@@ -239,104 +227,66 @@ def async_register_services(hass: HomeAssistant) -> None:
         duration = call.data[ATTR_DURATION]
         gpio_type = GpioType.POWER if button_type == BUTTON_TYPE_POWER else GpioType.RESET
 
-        async def service_logic(
-            coordinator: NanoKVMDataUpdateCoordinator,
-            client: NanoKVMClient,
-            host: str,
-        ) -> None:
-            await client.push_button(gpio_type, duration)
-            _LOGGER.debug("Button %s pushed for %d ms on %s", button_type, duration, host)
-
-        await _execute_service(call, SERVICE_PUSH_BUTTON, service_logic)
+        coordinator = _resolve_target_coordinator(call)
+        await _execute_service(
+            coordinator, SERVICE_PUSH_BUTTON, "push_button", gpio_type, duration
+        )
+        _log_service_done(
+            coordinator, "Button %s pushed for %d ms on %s", button_type, duration
+        )
 
     async def handle_paste_text(call: ServiceCall) -> None:
         """Handle the paste text service."""
-        text = call.data[ATTR_TEXT]
-
-        async def service_logic(
-            coordinator: NanoKVMDataUpdateCoordinator,
-            client: NanoKVMClient,
-            host: str,
-        ) -> None:
-            await client.paste_text(text)
-            _LOGGER.debug("Text pasted on %s", host)
-
-        await _execute_service(call, SERVICE_PASTE_TEXT, service_logic)
+        coordinator = _resolve_target_coordinator(call)
+        await _execute_service(
+            coordinator, SERVICE_PASTE_TEXT, "paste_text", call.data[ATTR_TEXT]
+        )
+        _log_service_done(coordinator, "Text pasted on %s")
 
     async def handle_reboot(call: ServiceCall) -> None:
         """Handle the reboot service."""
-
-        async def service_logic(
-            coordinator: NanoKVMDataUpdateCoordinator,
-            client: NanoKVMClient,
-            host: str,
-        ) -> None:
-            await client.reboot_system()
-            _LOGGER.debug("System reboot initiated on %s", host)
-
-        await _execute_service(call, SERVICE_REBOOT, service_logic)
+        coordinator = _resolve_target_coordinator(call)
+        await _execute_service(coordinator, SERVICE_REBOOT, "reboot_system")
+        _log_service_done(coordinator, "System reboot initiated on %s")
 
     async def handle_reset_hdmi(call: ServiceCall) -> None:
         """Handle the reset HDMI service."""
-
-        async def service_logic(
-            coordinator: NanoKVMDataUpdateCoordinator,
-            client: NanoKVMClient,
-            host: str,
-        ) -> None:
-            await client.reset_hdmi()
-            _LOGGER.debug("HDMI reset initiated on %s", host)
-
-        await _execute_service(call, SERVICE_RESET_HDMI, service_logic)
+        coordinator = _resolve_target_coordinator(call)
+        await _execute_service(coordinator, SERVICE_RESET_HDMI, "reset_hdmi")
+        _log_service_done(coordinator, "HDMI reset initiated on %s")
 
     async def handle_reset_hid(call: ServiceCall) -> None:
         """Handle the reset HID service."""
-
-        async def service_logic(
-            coordinator: NanoKVMDataUpdateCoordinator,
-            client: NanoKVMClient,
-            host: str,
-        ) -> None:
-            await client.reset_hid()
-            _LOGGER.debug("HID reset initiated on %s", host)
-
-        await _execute_service(call, SERVICE_RESET_HID, service_logic)
+        coordinator = _resolve_target_coordinator(call)
+        await _execute_service(coordinator, SERVICE_RESET_HID, "reset_hid")
+        _log_service_done(coordinator, "HID reset initiated on %s")
 
     async def handle_wake_on_lan(call: ServiceCall) -> None:
         """Handle the wake on LAN service."""
         mac = call.data[ATTR_MAC]
 
-        async def service_logic(
-            coordinator: NanoKVMDataUpdateCoordinator,
-            client: NanoKVMClient,
-            host: str,
-        ) -> None:
-            await client.send_wake_on_lan(mac)
-            _LOGGER.debug("Wake on LAN packet sent to %s via %s", mac, host)
-
-        await _execute_service(call, SERVICE_WAKE_ON_LAN, service_logic)
+        coordinator = _resolve_target_coordinator(call)
+        await _execute_service(coordinator, SERVICE_WAKE_ON_LAN, "send_wake_on_lan", mac)
+        _log_service_done(coordinator, "Wake on LAN packet sent to %s via %s", mac)
 
     async def handle_set_mouse_jiggler(call: ServiceCall) -> None:
         """Handle the set mouse jiggler service."""
         enabled = call.data[ATTR_ENABLED]
         mode_str = call.data[ATTR_MODE]
-        mode = (
-            MouseJigglerMode.ABSOLUTE
-            if mode_str == MouseJigglerMode.ABSOLUTE.value
-            else MouseJigglerMode.RELATIVE
-        )
-
-        async def service_logic(
-            coordinator: NanoKVMDataUpdateCoordinator,
-            client: NanoKVMClient,
-            host: str,
-        ) -> None:
-            await client.set_mouse_jiggler_state(enabled, mode)
-            _LOGGER.debug(
-                "Mouse jiggler on %s set to %s with mode %s", host, enabled, mode_str
-            )
+        # The schema restricts the mode to the keys of this mapping.
+        mode = _MOUSE_JIGGLER_MODES[mode_str]
 
-        await _execute_service(call, SERVICE_SET_MOUSE_JIGGLER, service_logic)
+        coordinator = _resolve_target_coordinator(call)
+        await _execute_service(
+            coordinator,
+            SERVICE_SET_MOUSE_JIGGLER,
+            "set_mouse_jiggler_state",
+            enabled,
+            mode,
+        )
+        _log_service_done(
+            coordinator, "Mouse jiggler set to %s with mode %s on %s", enabled, mode_str
+        )
 
     async def handle_set_led_strip(call: ServiceCall) -> None:
         """Handle the set LED strip service."""
@@ -351,108 +301,77 @@ def async_register_services(hass: HomeAssistant) -> None:
         ):
             raise HomeAssistantError("At least one LED strip field is required")
 
-        async def service_logic(
-            coordinator: NanoKVMDataUpdateCoordinator,
-            client: NanoKVMClient,
-            host: str,
-        ) -> None:
-            _ensure_pro(coordinator, SERVICE_SET_LED_STRIP)
-            try:
-                config = build_led_strip_config(
-                    coordinator.led_strip,
-                    on=call.data.get(ATTR_ON),
-                    brightness=call.data.get(ATTR_BRIGHTNESS),
-                    horizontal_count=call.data.get(ATTR_HORIZONTAL_COUNT),
-                    vertical_count=call.data.get(ATTR_VERTICAL_COUNT),
-                )
-            except ValueError as err:
-                raise HomeAssistantError(str(err)) from err
-
-            await client.set_led_strip(
-                on=config.on,
-                brightness=config.brightness,
-                horizontal_count=config.horizontal_count,
-                vertical_count=config.vertical_count,
+        coordinator = _resolve_target_coordinator(call)
+        _ensure_pro(coordinator, SERVICE_SET_LED_STRIP)
+        try:
+            config = build_led_strip_config(
+                coordinator.led_strip,
+                on=call.data.get(ATTR_ON),
+                brightness=call.data.get(ATTR_BRIGHTNESS),
+                horizontal_count=call.data.get(ATTR_HORIZONTAL_COUNT),
+                vertical_count=call.data.get(ATTR_VERTICAL_COUNT),
             )
-            _LOGGER.debug("LED strip settings updated on %s", host)
-
-        await _execute_service(call, SERVICE_SET_LED_STRIP, service_logic)
-        await _resolve_target_coordinator(call).async_request_refresh()
+        except ValueError as err:
+            raise HomeAssistantError(str(err)) from err
+
+        await _execute_service(
+            coordinator,
+            SERVICE_SET_LED_STRIP,
+            "set_led_strip",
+            on=config.on,
+            brightness=config.brightness,
+            horizontal_count=config.horizontal_count,
+            vertical_count=config.vertical_count,
+        )
+        _log_service_done(coordinator, "LED strip settings updated on %s")
+        await coordinator.async_request_refresh()
 
     async def handle_scan_wifi(call: ServiceCall) -> ServiceResponse:
         """Handle the scan Wi-Fi response service."""
-
-        async def service_logic(
-            coordinator: NanoKVMDataUpdateCoordinator,
-            client: NanoKVMClient,
-            host: str,
-        ) -> Any:
-            _ensure_pro(coordinator, SERVICE_SCAN_WIFI)
-            return await client.scan_wifi()
-
-        return await _execute_response_service(call, SERVICE_SCAN_WIFI, service_logic)
+        coordinator = _resolve_target_coordinator(call)
+        _ensure_pro(coordinator, SERVICE_SCAN_WIFI)
+        return _model_to_response(
+            await _execute_service(coordinator, SERVICE_SCAN_WIFI, "scan_wifi")
+        )
 
     async def handle_list_images(call: ServiceCall) -> ServiceResponse:
         """Handle the list images response service."""
-
-        async def service_logic(
-            coordinator: NanoKVMDataUpdateCoordinator,
-            client: NanoKVMClient,
-            host: str,
-        ) -> Any:
-            return await client.get_images()
-
-        return await _execute_response_service(call, SERVICE_LIST_IMAGES, service_logic)
+        return _model_to_response(
+            await _execute_service(
+                _resolve_target_coordinator(call), SERVICE_LIST_IMAGES, "get_images"
+            )
+        )
 
     async def handle_image_download_enabled(call: ServiceCall) -> ServiceResponse:
         """Handle the image download enabled response service."""
-
-        async def service_logic(
-            coordinator: NanoKVMDataUpdateCoordinator,
-            client: NanoKVMClient,
-            host: str,
-        ) -> Any:
-            return await client.is_image_download_enabled()
-
-        return await _execute_response_service(
-            call,
-            SERVICE_IMAGE_DOWNLOAD_ENABLED,
-            service_logic,
+        return _model_to_response(
+            await _execute_service(
+                _resolve_target_coordinator(call),
+                SERVICE_IMAGE_DOWNLOAD_ENABLED,
+                "is_image_download_enabled",
+            )
         )
 
     async def handle_get_image_download_status(
         call: ServiceCall,
     ) -> ServiceResponse:
         """Handle the image download status response service."""
-
-        async def service_logic(
-            coordinator: NanoKVMDataUpdateCoordinator,
-            client: NanoKVMClient,
-            host: str,
-        ) -> Any:
-            return await client.get_image_download_status()
-
-        return await _execute_response_service(
-            call,
-            SERVICE_GET_IMAGE_DOWNLOAD_STATUS,
-            service_logic,
+        return _model_to_response(
+            await _execute_service(
+                _resolve_target_coordinator(call),
+                SERVICE_GET_IMAGE_DOWNLOAD_STATUS,
+                "get_image_download_status",
+            )
         )
 
     async def handle_list_custom_edids(call: ServiceCall) -> ServiceResponse:
         """Handle the list custom EDIDs response service."""
-
-        async def service_logic(
-            coordinator: NanoKVMDataUpdateCoordinator,
-            client: NanoKVMClient,
-            host: str,
-        ) -> Any:
-            _ensure_pro(coordinator, SERVICE_LIST_CUSTOM_EDIDS)
-            return await client.get_custom_edid_list()
-
-        return await _execute_response_service(
-            call,
-            SERVICE_LIST_CUSTOM_EDIDS,
-            service_logic,
+        coordinator = _resolve_target_coordinator(call)
+        _ensure_pro(coordinator, SERVICE_LIST_CUSTOM_EDIDS)
+        return _model_to_response(
+            await _execute_service(
+                coordinator, SERVICE_LIST_CUSTOM_EDIDS, "get_custom_edid_list"
+            )
         )
 
     hass.services.async_register(
@@ -524,6 +443,8 @@ def async_register_services(hass: HomeAssistant) -> None:
 
 def async_unregister_services(hass: HomeAssistant) -> None:
     """Unregister integration services."""
+    # async_remove warns about unknown services, so only remove registered ones.
+    registered = hass.services.async_services_for_domain(DOMAIN)
     for service_name in _SERVICE_NAMES:
-        if hass.services.has_service(DOMAIN, service_name):
+        if service_name in registered:
             hass.services.async_remove(DOMAIN, service_name)
@@ -1,12 +1,32 @@
 """SSH metrics collection helpers for NanoKVM."""
 from __future__ import annotations
 
+import asyncio
 import datetime
+import re
 from dataclasses import dataclass
 
+import paramiko
 from homeassistant.util import dt as dt_util
 
-from nanokvm.ssh_client import NanoKVMSSH
+from nanokvm.ssh_client import NanoKVMSSH, NanoKVMSSHError
+
+_SECTION_SEPARATOR = "---"
+_METRICS_COMMANDS = (
+    "cat /proc/stat",
+    "cat /sys/class/thermal/thermal_zone0/temp",
+    "cat /proc/meminfo",
+    # POSIX format keeps each filesystem on one line with fixed columns.
+    "df -Pk /",
+)
+_BTIME_RE = re.compile(r"^btime (\d+)$", re.MULTILINE)
+_MEMINFO_RE = re.compile(r"^(MemTotal|MemAvailable):\s+(\d+)", re.MULTILINE)
+_WATCHDOG_STATE_COMMAND = "test -f /etc/kvm/watchdog && echo 1 || echo 0"
+# Run every metric command in a single exec to pay one channel round trip.
+_METRICS_COMMAND = f"; echo {_SECTION_SEPARATOR}; ".join(_METRICS_COMMANDS)
+_METRICS_WITH_WATCHDOG_COMMAND = f"; echo {_SECTION_SEPARATOR}; ".join(
+    (*_METRICS_COMMANDS, _WATCHDOG_STATE_COMMAND)
+)
 
 
 @dataclass(slots=True)
@@ -29,35 +49,70 @@ class SSHMetricsCollector:
         """Initialize the SSH collector."""
         self._password = password
         self._client = NanoKVMSSH(host=host, username=username)
+        # Trusted until it reports inactive or a command hits a transport error.
+        self._transport: paramiko.Transport | None = None
+        # Serialises session use so overlapping callers cannot each open a
+        # client or swap the transport out from under a running command.
+        self._lock = asyncio.Lock()
 
     async def disconnect(self) -> None:
         """Disconnect the underlying SSH client if connected."""
+        async with self._lock:
+            await self._async_disconnect()
+
+    async def _async_disconnect(self) -> None:
+        """Disconnect the SSH client; the caller must hold the lock."""
+        self._transport = None
         if self._client.ssh_client:
             await self._client.disconnect()
 
     async def _async_ensure_connected(self) -> None:
         """Connect the SSH client when needed."""
-        ssh_client = self._client.ssh_client
-        transport = ssh_client.get_transport() if ssh_client is not None else None
-
-        if ssh_client is None or transport is None or not transport.is_active():
+        if self._transport is None or not self._transport.is_active():
             await self._client.authenticate(self._password)
+            self._transport = self._client.ssh_client.get_transport()
+
+    async def _async_run_metrics_command(self, command: str) -> str:
+        """Run a command on the persistent session, reconnecting once if stale."""
+        # Only transport failures drop the session; it is otherwise kept open
+        # across polls so each collect skips the SSH handshake.
+        try:
+            await self._async_ensure_connected()
+            return await self._client.run_command(command)
+        except (paramiko.SSHException, OSError):
+            # The cached session may have died with the device (e.g. reboot).
+            await self._async_disconnect()
+        except NanoKVMSSHError:
+            await self._async_disconnect()
+            raise
+
+        try:
+            await self._async_ensure_connected()
+            return await self._client.run_command(command)
+        except (NanoKVMSSHError, paramiko.SSHException, OSError):
+            await self._async_disconnect()
+            raise
 
     async def collect(self, *, include_watchdog: bool = False) -> SSHMetricsSnapshot:
         """Collect uptime, memory, storage, and optional watchdog state."""
-        await self._async_ensure_connected()
+        async with self._lock:
+            output = await self._async_run_metrics_command(
+                _METRICS_WITH_WATCHDOG_COMMAND if include_watchdog else _METRICS_COMMAND
+            )
 
-        uptime = await self._fetch_uptime()
-        cpu_temperature = await self._fetch_cpu_temperature()
-        memory_stats = await self._fetch_memory()
-        storage_stats = await self._fetch_storage()
         watchdog_enabled = None
         if include_watchdog:
-            watchdog_enabled = await self.fetch_watchdog_enabled()
+            *sections, watchdog_raw = _split_sections(output, len(_METRICS_COMMANDS) + 1)
+            watchdog_enabled = _parse_watchdog_state(watchdog_raw)
+        else:
+            sections = _split_sections(output, len(_METRICS_COMMANDS))
+        stat_raw, temperature_raw, meminfo, df_output = sections
+        memory_stats = _parse_memory(meminfo)
+        storage_stats = _parse_storage(df_output)
 
         return SSHMetricsSnapshot(
-            uptime=uptime,
-            cpu_temperature=cpu_temperature,
+            uptime=_parse_uptime(stat_raw),
+            cpu_temperature=_parse_cpu_temperature(temperature_raw),
             memory_total=memory_stats.get("total"),
             memory_used_percent=memory_stats.get("used_percent"),
             storage_total=storage_stats.get("total"),
@@ -67,67 +122,91 @@ class SSHMetricsCollector:
 
     async def fetch_watchdog_enabled(self) -> bool:
         """Return whether the NanoKVM watchdog file exists."""
-        await self._async_ensure_connected()
-        output = await self._client.run_command("test -f /etc/kvm/watchdog && echo 1 || echo 0")
-        return output.strip() == "1"
+        async with self._lock:
+            await self._async_ensure_connected()
+            output = await self._client.run_command(_WATCHDOG_STATE_COMMAND)
+        return _parse_watchdog_state(output)
 
     async def set_watchdog_enabled(self, enabled: bool) -> None:
         """Enable or disable the NanoKVM watchdog file."""
-        await self._async_ensure_connected()
         command = "touch /etc/kvm/watchdog" if enabled else "rm -f /etc/kvm/watchdog"
-        await self._client.run_command(command)
-
-    async def _fetch_uptime(self) -> datetime.datetime | None:
-        """Fetch uptime via SSH."""
-        stat_raw = await self._client.run_command("cat /proc/stat")
-        for line in stat_raw.splitlines():
-            parts = line.split()
-            if len(parts) == 2 and parts[0] == "btime":
-                return dt_util.utc_from_timestamp(int(parts[1]))
-        return None
-
-    async def _fetch_memory(self) -> dict[str, float | None]:
-        """Fetch memory stats via SSH."""
-        meminfo = await self._client.run_command("cat /proc/meminfo")
-        mem_data: dict[str, int] = {}
-        for line in meminfo.splitlines():
-            parts = line.split()
-            if len(parts) >= 2:
-                mem_data[parts[0].rstrip(":")] = int(parts[1])
-
-        total_mb: float | None = None
-        used_percent: float | None = None
-
-        mem_total_kb = mem_data.get("MemTotal")
-        if mem_total_kb is not None:
-            total_mb = round(mem_total_kb / 1024, 2)
-            mem_available_kb = mem_data.get("MemAvailable")
-            if total_mb > 0 and mem_available_kb is not None:
-                memory_free = round(mem_available_kb / 1024, 2)
-                memory_used = round(total_mb - memory_free, 2)
-                used_percent = round((memory_used / total_mb) * 100, 2)
-
-        return {"total": total_mb, "used_percent": used_percent}
-
-    async def _fetch_cpu_temperature(self) -> float | None:
-        """Fetch CPU temperature in Celsius via SSH."""
-        output = await self._client.run_command("cat /sys/class/thermal/thermal_zone0/temp")
-        value = float(output.strip())
-        if value > 1000:
-            value /= 1000
-        return round(value, 1)
-
-    async def _fetch_storage(self) -> dict[str, float | None]:
-        """Fetch storage stats via SSH."""
-        df_output = await self._client.run_command("df -k /")
-        lines = df_output.splitlines()
-        total_mb: float | None = None
-        used_percent: float | None = None
-
-        if len(lines) >= 2:
-            parts = lines[1].split()
-            if len(parts) >= 5:
-                total_mb = round(int(parts[1]) / 1024, 2)
-                used_percent = float(parts[4].rstrip("%"))
-
-        return {"total": total_mb, "used_percent": used_percent}
+        async with self._lock:
+            await self._async_ensure_connected()
+            await self._client.run_command(command)
+
+
+def _split_sections(output: str, count: int) -> list[str]:
+    """Split batched command output on separator lines."""
+    sections: list[list[str]] = [[]]
+    for line in output.splitlines():
+        if line == _SECTION_SEPARATOR:
+            sections.append([])
+        else:
+            sections[-1].append(line)
+
+    if len(sections) != count:
+        raise ValueError(
+            f"Expected {count} SSH metric sections, received {len(sections)}"
+        )
+    return ["\n".join(section) for section in sections]
+
+
+def _parse_uptime(stat_raw: str) -> datetime.datetime | None:
+    """Parse boot time from /proc/stat."""
+    if match := _BTIME_RE.search(stat_raw):
+        return dt_util.utc_from_timestamp(int(match.group(1)))
+    return None
+
+
+def _percent(part: int, whole: int) -> float:
+    """Return part/whole as a percentage rounded to two decimals."""
+    return round(part * 100 / whole, 2)
+
+
+def _parse_memory(meminfo: str) -> dict[str, float | None]:
+    """Parse memory stats from /proc/meminfo."""
+    # Scan for the two fields used instead of splitting all ~50 lines.
+    mem_data = {key: int(value) for key, value in _MEMINFO_RE.findall(meminfo)}
+
+    total_mb: float | None = None
+    used_percent: float | None = None
+
+    mem_total_kb = mem_data.get("MemTotal")
+    if mem_total_kb is not None:
+        total_mb = round(mem_total_kb / 1024, 2)
+        mem_available_kb = mem_data.get("MemAvailable")
+        if mem_total_kb > 0 and mem_available_kb is not None:
+            used_percent = _percent(mem_total_kb - mem_available_kb, mem_total_kb)
+
+    return {"total": total_mb, "used_percent": used_percent}
+
+
+def _parse_cpu_temperature(output: str) -> float | None:
+    """Parse CPU temperature in Celsius from the thermal zone reading."""
+    value = float(output.strip())
+    if value > 1000:
+        value /= 1000
+    return round(value, 1)
+
+
+def _parse_watchdog_state(output: str) -> bool:
+    """Parse the watchdog file test result."""
+    return output.strip() == "1"
+
+
+def _parse_storage(df_output: str) -> dict[str, float | None]:
+    """Parse root filesystem stats from POSIX df output."""
+    lines = df_output.splitlines()
+    total_mb: float | None = None
+    used_percent: float | None = None
+
+    if len(lines) >= 2:
+        parts = lines[-1].split()
+        if len(parts) >= 4:
+            total_kb, used_kb, available_kb = map(int, parts[1:4])
+            total_mb = round(total_kb / 1024, 2)
+            # Matches df's Capacity column: reserved blocks are excluded.
+            if used_kb + available_kb > 0:
+                used_percent = _percent(used_kb, used_kb + available_kb)
+
+    return {"total": total_mb, "used_percent": used_percent}
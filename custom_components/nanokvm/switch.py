@@ -18,6 +18,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from nanokvm.models import GpioType, VirtualDevice
 
 from .const import (
+    COORDINATOR_CONTEXT_SSH,
     DOMAIN,
     ICON_DISK,
     ICON_HDMI,
@@ -30,7 +31,7 @@ from .const import (
     SIGNAL_NEW_SSH_SWITCHES,
 )
 from .coordinator import NanoKVMDataUpdateCoordinator
-from .entity import NanoKVMEntity
+from .entity import NanoKVMEntity, always_available, always_false
 from .led import build_led_strip_config
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,13 +41,12 @@ _LOGGER = logging.getLogger(__name__)
 class NanoKVMSwitchEntityDescription(SwitchEntityDescription):
     """Describes NanoKVM switch entity."""
 
-    value_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = (
-        lambda _: False
-    )
-    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
+    value_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = always_false
+    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = always_available
     turn_on_fn: Callable[[NanoKVMDataUpdateCoordinator], Awaitable[Any]] | None = None
     turn_off_fn: Callable[[NanoKVMDataUpdateCoordinator], Awaitable[Any]] | None = None
     virtual_device: VirtualDevice | None = None
+    coordinator_context: str | None = None
 
 
 def _hdmi_value(coordinator: NanoKVMDataUpdateCoordinator) -> bool:
@@ -286,6 +286,7 @@ SSH_SWITCHES: tuple[NanoKVMSwitchEntityDescription, ...] = (
         entity_category=EntityCategory.CONFIG,
         value_fn=_watchdog_value,
         available_fn=_watchdog_available,
+        coordinator_context=COORDINATOR_CONTEXT_SSH,
     ),
 )
 
@@ -381,6 +382,7 @@ class NanoKVMSwitch(NanoKVMEntity, SwitchEntity):
         super().__init__(
             coordinator=coordinator,
             unique_id_suffix=f"switch_{description.key}",
+            context=description.coordinator_context,
         )
 
     @property
@@ -397,16 +399,14 @@ class NanoKVMSwitch(NanoKVMEntity, SwitchEntity):
         """Turn on the switch."""
         if self.entity_description.turn_on_fn is None:
             raise RuntimeError(f"Missing turn_on handler for switch: {self.entity_description.key}")
-        async with self.coordinator.client:
-            await self.entity_description.turn_on_fn(self.coordinator)
+        await self.entity_description.turn_on_fn(self.coordinator)
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
         if self.entity_description.turn_off_fn is None:
             raise RuntimeError(f"Missing turn_off handler for switch: {self.entity_description.key}")
-        async with self.coordinator.client:
-            await self.entity_description.turn_off_fn(self.coordinator)
+        await self.entity_description.turn_off_fn(self.coordinator)
         await self.coordinator.async_request_refresh()
 
 
@@ -417,8 +417,7 @@ class NanoKVMPowerSwitch(NanoKVMSwitch):
         """Turn on the switch."""
         if self.entity_description.turn_on_fn is None:
             raise RuntimeError(f"Missing turn_on handler for switch: {self.entity_description.key}")
-        async with self.coordinator.client:
-            await self.entity_description.turn_on_fn(self.coordinator)
+        await self.entity_description.turn_on_fn(self.coordinator)
         await asyncio.sleep(1)
         await self.coordinator.async_request_refresh()
 
@@ -426,8 +425,7 @@ class NanoKVMPowerSwitch(NanoKVMSwitch):
         """Turn off the power switch with monitoring for actual shutdown."""
         if self.entity_description.turn_off_fn is None:
             raise RuntimeError(f"Missing turn_off handler for switch: {self.entity_description.key}")
-        async with self.coordinator.client:
-            await self.entity_description.turn_off_fn(self.coordinator)
+        await self.entity_description.turn_off_fn(self.coordinator)
 
         SHUTDOWN_TIMEOUT = 300
         SHUTDOWN_POLL_INTERVAL = 5
@@ -459,8 +457,7 @@ class NanoKVMVirtualDeviceSwitch(NanoKVMSwitch):
         if self.is_on == enabled:
             return
 
-        async with self.coordinator.client:
-            await self.coordinator.client.update_virtual_device(virtual_device)
+        await self.coordinator.client.update_virtual_device(virtual_device)
         await self.coordinator.async_request_refresh()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -17,14 +17,14 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import NanoKVMDataUpdateCoordinator
-from .entity import NanoKVMEntity
+from .entity import NanoKVMEntity, always_available
 
 
 @dataclass(frozen=True, kw_only=True)
 class NanoKVMUpdateEntityDescription(UpdateEntityDescription):
     """Describes NanoKVM update entity."""
 
-    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = lambda _: True
+    available_fn: Callable[[NanoKVMDataUpdateCoordinator], bool] = always_available
 
 
 UPDATES: tuple[NanoKVMUpdateEntityDescription, ...] = (
@@ -125,6 +125,5 @@ class NanoKVMUpdate(NanoKVMEntity, UpdateEntity):
     ) -> None:
         """Trigger NanoKVM application update."""
         del version, backup, kwargs
-        async with self.coordinator.client:
-            await self.coordinator.client.update_application()
+        await self.coordinator.client.update_application()
         await self.coordinator.async_request_refresh()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 from yarl import URL
 
@@ -40,9 +41,7 @@ def _api_base_url(origin: URL, scheme: str) -> str:
 
 def _web_ui_path(path: str) -> str:
     """Convert an API base path into the corresponding web UI path."""
-    normalized_path = path.rstrip("/")
-    if normalized_path.endswith("/api"):
-        normalized_path = normalized_path[:-4]
+    normalized_path = path.rstrip("/").removesuffix("/api")
     return f"{normalized_path}/" if normalized_path else "/"
 
 
@@ -62,8 +61,13 @@ class NanoKVMConnectionTarget:
     has_explicit_scheme: bool
 
     @classmethod
+    @lru_cache(maxsize=32)
     def from_host(cls, host: str) -> NanoKVMConnectionTarget:
-        """Parse the stored host value into a reusable connection target."""
+        """Parse the stored host value into a reusable connection target.
+
+        Targets are immutable, so repeated lookups for the same host string
+        (service calls, config flow steps) share one parsed instance.
+        """
         origin, has_explicit_scheme = _parse_host(host)
         return cls(origin=origin, has_explicit_scheme=has_explicit_scheme)
 